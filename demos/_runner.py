@@ -0,0 +1,13 @@
+"""
+Shared entry point for the demos
+"""
+import asyncio
+
+
+def run_demo(main):
+    """Run a demo's main() coroutine, on uvloop's faster event loop when installed (optional, POSIX only)"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -1,9 +1,14 @@
 """
 Interactive demo of MiniAgent framework
 """
-import asyncio
+import ast
+import builtins
+import operator
 import sys
 import os
+import time
+from datetime import datetime
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Add parent directory to path to import framework
@@ -13,17 +18,188 @@ from miniagent_framework.core import Agent, AgentConfig, Thread
 from miniagent_framework.core.tools import ToolRegistry, KnowledgeBaseTool, WebSearchTool
 from miniagent_framework.core.events import StreamCallback, EventType
 from miniagent_framework.core.llm import constant_retry
+from _runner import run_demo
 
 # Load environment variables
 load_dotenv()
 
 
+# ============== Calculator helpers ==============
+
+# Largest integer power (in bits) the calculator will compute; anything
+# bigger like 9**9**9 would block the event loop and fill the result cache
+MAX_POW_BITS = 10_000
+
+
+def _safe_pow(base, exponent, modulus=None):
+    """pow() that raises ValueError instead of building huge integers"""
+    if modulus is not None:
+        return pow(base, exponent, modulus)
+    if (isinstance(base, int) and isinstance(exponent, int)
+            and abs(base) > 1 and base.bit_length() * exponent > MAX_POW_BITS):
+        raise ValueError("Result too large")
+    return pow(base, exponent)
+
+
+# Functions the calculate tool may call, resolved once at import
+SAFE_NAMES = {
+    name: getattr(builtins, name)
+    for name in ('abs', 'round', 'min', 'max', 'sum')
+}
+SAFE_NAMES['pow'] = _safe_pow
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _safe_pow,
+}
+
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Operator results may be complex, e.g. (-8)**0.5
+_NUMBER_TYPES = (int, float, complex)
+
+
+def _eval_number(node):
+    """Evaluate a node that must be a number, so lists can't be repeated or added"""
+    value = _eval_node(node)
+    if type(value) not in _NUMBER_TYPES:
+        raise ValueError("Expected a number")
+    return value
+
+
+@lru_cache(maxsize=256)
+def _parse_expression(expression: str) -> ast.expr:
+    """Parse an expression once; repeated expressions reuse the cached tree"""
+    return ast.parse(expression.strip(), mode="eval").body
+
+
+def _eval_constant(node: ast.Constant):
+    if type(node.value) not in (int, float):
+        raise ValueError(f"Unsupported constant: {node.value!r}")
+    return node.value
+
+
+def _eval_binop(node: ast.BinOp):
+    op = _BIN_OPS.get(type(node.op))
+    if op is None:
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    return op(_eval_number(node.left), _eval_number(node.right))
+
+
+def _eval_unaryop(node: ast.UnaryOp):
+    op = _UNARY_OPS.get(type(node.op))
+    if op is None:
+        raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
+    return op(_eval_number(node.operand))
+
+
+def _eval_call(node: ast.Call):
+    if not isinstance(node.func, ast.Name) or node.func.id not in SAFE_NAMES or node.keywords:
+        raise ValueError("Unsupported function call")
+    return SAFE_NAMES[node.func.id](*(_eval_node(arg) for arg in node.args))
+
+
+def _eval_list(node: ast.List):
+    return [_eval_number(elt) for elt in node.elts]
+
+
+def _eval_tuple(node: ast.Tuple):
+    return tuple(_eval_number(elt) for elt in node.elts)
+
+
+_NODE_HANDLERS = {
+    ast.Constant: _eval_constant,
+    ast.BinOp: _eval_binop,
+    ast.UnaryOp: _eval_unaryop,
+    ast.Call: _eval_call,
+    ast.List: _eval_list,
+    ast.Tuple: _eval_tuple,
+}
+
+
+def _eval_node(node):
+    """Evaluate the arithmetic subset of Python by dispatching on node type"""
+    handler = _NODE_HANDLERS.get(type(node))
+    if handler is None:
+        raise ValueError(f"Unsupported expression: {type(node).__name__}")
+    return handler(node)
+
+
+@lru_cache(maxsize=256)
+def _evaluate_number(expression: str):
+    return _eval_number(_parse_expression(expression))
+
+
+def evaluate_expression(expression: str):
+    """
+    Safely evaluate a math expression without eval().
+    Numeric results are immutable and memoized per expression string; list and
+    tuple literals are rebuilt from the cached tree so callers get a fresh value.
+    """
+    node = _parse_expression(expression)
+    if type(node) in (ast.List, ast.Tuple):
+        return _eval_node(node)
+    return _evaluate_number(expression)
+
+
+# ============== Date/time helpers ==============
+
+DATETIME_FORMAT = '%A, %B %d, %Y at %I:%M %p'
+
+# The format has minute resolution, so the string is reused within a minute
+_datetime_cache = {"minute": None, "text": ""}
+
+
+def format_current_datetime() -> str:
+    """Format the current local time, reformatting at most once per minute"""
+    minute = int(time.time() // 60)
+    if _datetime_cache["minute"] != minute:
+        _datetime_cache["text"] = datetime.now().strftime(DATETIME_FORMAT)
+        _datetime_cache["minute"] = minute
+    return _datetime_cache["text"]
+
+
+# ============== Console text ==============
+
+# Multi-line messages are joined once and written with a single print()
+WELCOME_MESSAGE = "\n".join([
+    "\n🎉 Welcome! I'm MiniBot, your AI assistant.",
+    "I can help with:",
+    "  • Product information (pricing, features, support)",
+    "  • Web searches",
+    "  • Math calculations",
+    "  • Current date/time",
+    "\nCommands:",
+    "  • Type 'quit' or 'exit' to end",
+    "  • Type 'reset' to clear conversation history",
+    "  • Type 'help' for this message",
+    "  • Type 'stream on/off' to toggle streaming",
+    "-"*60,
+])
+
+HELP_MESSAGE = "\n".join([
+    "\n📚 Available commands:",
+    "  • Ask about pricing, features, or support",
+    "  • Ask me to calculate something (e.g., 'What's 25 * 4?')",
+    "  • Ask for the current date/time",
+    "  • Ask me to search the web for information",
+    "  • Type 'reset' to clear history",
+    "  • Type 'quit' to exit",
+])
+
+
 async def main():
     """Interactive demo of the framework"""
     
-    print("="*60)
-    print("🤖 MiniAgent Framework - Interactive Demo")
-    print("="*60)
+    print("="*60 + "\n🤖 MiniAgent Framework - Interactive Demo\n" + "="*60)
     
     # 1. Set up tools
     registry = ToolRegistry()
@@ -65,21 +241,14 @@ All plans include SSL, daily backups, and 99.9% uptime guarantee.""",
     @registry.tool(description="Calculate math expressions")
     async def calculate(expression: str):
         try:
-            # Safe eval for simple math
-            allowed_names = {
-                k: v for k, v in __builtins__.items() 
-                if k in ['abs', 'round', 'min', 'max', 'sum', 'pow']
-            }
-            result = eval(expression, {"__builtins__": {}}, allowed_names)
+            result = evaluate_expression(expression)
             return f"📐 Calculation: {expression} = {result}"
-        except:
+        except Exception:
             return "❌ Invalid expression. Try something like: 2+2, 10*5, 100/4"
     
     @registry.tool(description="Get current date and time")
     async def get_datetime():
-        from datetime import datetime
-        now = datetime.now()
-        return f"📅 Current date/time: {now.strftime('%A, %B %d, %Y at %I:%M %p')}"
+        return f"📅 Current date/time: {format_current_datetime()}"
     
     # 2. Set up callbacks to show what's happening
     callbacks = StreamCallback()
@@ -132,18 +301,7 @@ Use the appropriate tools to provide accurate, helpful responses. For product in
     thread = Thread()  # Maintain conversation history
     
     # 5. Welcome message
-    print("\n🎉 Welcome! I'm MiniBot, your AI assistant.")
-    print("I can help with:")
-    print("  • Product information (pricing, features, support)")
-    print("  • Web searches")
-    print("  • Math calculations")
-    print("  • Current date/time")
-    print("\nCommands:")
-    print("  • Type 'quit' or 'exit' to end")
-    print("  • Type 'reset' to clear conversation history")
-    print("  • Type 'help' for this message")
-    print("  • Type 'stream on/off' to toggle streaming")
-    print("-"*60)
+    print(WELCOME_MESSAGE)
 
     stream_enabled = True  # Enable streaming for better UX
     
@@ -153,32 +311,28 @@ Use the appropriate tools to provide accurate, helpful responses. For product in
             # Get user input
             user_input = input("\n👤 You: ").strip()
             
+            command = user_input.lower()  # Lowercase once for all command checks
+            
             # Check for commands
-            if user_input.lower() in ['quit', 'exit', 'bye']:
+            if command in ['quit', 'exit', 'bye']:
                 print("\n👋 Goodbye! Thanks for using MiniAgent!")
                 break
             
-            elif user_input.lower() == 'reset':
+            elif command == 'reset':
                 thread = Thread()  # New thread
                 print("🔄 Conversation history cleared!")
                 continue
             
-            elif user_input.lower() == 'help':
-                print("\n📚 Available commands:")
-                print("  • Ask about pricing, features, or support")
-                print("  • Ask me to calculate something (e.g., 'What's 25 * 4?')")
-                print("  • Ask for the current date/time")
-                print("  • Ask me to search the web for information")
-                print("  • Type 'reset' to clear history")
-                print("  • Type 'quit' to exit")
+            elif command == 'help':
+                print(HELP_MESSAGE)
                 continue
             
-            elif user_input.lower() == 'stream on':
+            elif command == 'stream on':
                 stream_enabled = True
                 print("✅ Streaming enabled")
                 continue
             
-            elif user_input.lower() == 'stream off':
+            elif command == 'stream off':
                 stream_enabled = False
                 print("✅ Streaming disabled")
                 continue
@@ -187,8 +341,7 @@ Use the appropriate tools to provide accurate, helpful responses. For product in
                 continue
             
             # Process with agent
-            print("-"*40)
-            print("🤖 MiniBot: ", end="")
+            print("-"*40 + "\n🤖 MiniBot: ", end="")
             
             response = await agent.run(
                 user_input=user_input,
@@ -204,13 +357,10 @@ Use the appropriate tools to provide accurate, helpful responses. For product in
             print("\n\n👋 Goodbye!")
             break
         except Exception as e:
-            print(f"\n❌ Error: {str(e)}")
-            print("Please try again or type 'help' for assistance.")
+            print(f"\n❌ Error: {str(e)}\nPlease try again or type 'help' for assistance.")
     
-    print("\n" + "="*60)
-    print("✨ Thanks for trying MiniAgent Framework!")
-    print("="*60)
+    print("\n" + "="*60 + "\n✨ Thanks for trying MiniAgent Framework!\n" + "="*60)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_demo(main())
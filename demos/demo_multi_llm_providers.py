@@ -6,6 +6,8 @@ Shows how to switch between providers and compare responses
 import asyncio
 import os
 import sys
+import traceback
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
 # Add parent directory to path
@@ -15,10 +17,29 @@ from miniagent_framework.core import Agent, AgentConfig, Thread
 from miniagent_framework.core.tools import ToolRegistry
 from miniagent_framework.core.events import StreamCallback, EventType
 from miniagent_framework.core.llm import LLMProvider
+from _runner import run_demo
 
 # Load environment variables
 load_dotenv()
 
+# Seconds to wait for a single provider before giving up on it
+PROVIDER_TIMEOUT = 30.0
+
+# Queries run against each provider, in order, on one shared thread
+TEST_QUERIES: Tuple[str, ...] = (
+    "What time is it?",
+    "Calculate 42 * 17",
+    "Tell me a very short joke (one line)",
+)
+
+# Prompt sent to every provider in compare_providers
+COMPARISON_PROMPT = "Explain quantum computing in exactly one sentence."
+
+
+def format_error(error: Exception) -> str:
+    """Format an exception as 'Type: message'"""
+    return "".join(traceback.format_exception_only(type(error), error)).strip()
+
 
 # ============== Sample Tools ==============
 
@@ -42,9 +63,24 @@ def create_sample_tools():
     return registry
 
 
+def create_stream_callbacks(stream_end: str = "\n") -> StreamCallback:
+    """
+    Create callbacks that print streamed chunks inline.
+    Build once and share across agents rather than rebuilding per run.
+    """
+    callbacks = StreamCallback()
+    callbacks.on(EventType.STREAM_CHUNK, lambda e: print(e.content, end="", flush=True))
+    callbacks.on(EventType.STREAM_END, lambda e: print(stream_end))
+    return callbacks
+
+
 # ============== Demo Functions ==============
 
-async def test_provider(provider_name: str, api_key: str = None):
+async def test_provider(
+    provider_name: str,
+    api_key: str = None,
+    callbacks: Optional[StreamCallback] = None
+):
     """Test a specific LLM provider"""
     print(f"\n{'='*60}")
     print(f"🤖 Testing {provider_name.upper()} Provider")
@@ -68,35 +104,25 @@ async def test_provider(provider_name: str, api_key: str = None):
     # Create agent
     try:
         tools = create_sample_tools()
-        agent = Agent(config=config, tools=tools)
-        
-        # Set up streaming callback
-        callbacks = StreamCallback()
-        callbacks.on(EventType.STREAM_CHUNK, lambda e: print(e.content, end="", flush=True))
-        callbacks.on(EventType.STREAM_END, lambda e: print("\n"))
-        
-        agent.callbacks = callbacks
-        
-        # Test queries
-        test_queries = [
-            "What time is it?",
-            "Calculate 42 * 17",
-            "Tell me a very short joke (one line)"
-        ]
+        agent = Agent(
+            config=config,
+            tools=tools,
+            callbacks=callbacks or create_stream_callbacks()
+        )
         
         thread = Thread()
         
-        for query in test_queries:
+        for query in TEST_QUERIES:
             print(f"\n📝 Query: {query}")
             print("💬 Response: ", end="")
             
             try:
                 await agent.run(query, thread=thread, stream=True)
             except Exception as e:
-                print(f"❌ Error: {e}")
+                print(f"❌ Error: {format_error(e)}")
         
     except Exception as e:
-        print(f"❌ Failed to initialize {provider_name}: {e}")
+        print(f"❌ Failed to initialize {provider_name}: {format_error(e)}")
         print(f"   Make sure {provider_name.upper()}_API_KEY is set in your environment")
         return False
     
@@ -109,7 +135,7 @@ async def compare_providers():
     print("🔄 COMPARING PROVIDERS")
     print("="*60)
     
-    prompt = "Explain quantum computing in exactly one sentence."
+    prompt = COMPARISON_PROMPT
     
     providers_to_test = []
     
@@ -131,22 +157,42 @@ async def compare_providers():
     print(f"\n📝 Prompt: {prompt}")
     print(f"Testing providers: {', '.join(providers_to_test)}\n")
     
-    for provider in providers_to_test:
-        print(f"\n{provider.upper()}:")
-        print("-" * 40)
-        
+    loop = asyncio.get_running_loop()
+    
+    async def ask(provider: str):
+        """Run the prompt on its own agent and thread, returning (response, seconds)"""
         config = AgentConfig(
             provider=provider,
             temperature=0.7,
             stream_by_default=False  # Non-streaming for comparison
         )
+        start = loop.time()
+        agent = Agent(config=config)
+        response = await asyncio.wait_for(
+            agent.run(prompt, thread=Thread(), stream=False),
+            timeout=PROVIDER_TIMEOUT
+        )
+        return response, loop.time() - start
+    
+    # Providers are independent, so query them concurrently; a slow or
+    # failing provider is reported on its own without cancelling the others
+    results = await asyncio.gather(
+        *(ask(provider) for provider in providers_to_test),
+        return_exceptions=True
+    )
+    
+    for provider, result in zip(providers_to_test, results):
+        print(f"\n{provider.upper()}:")
+        print("-" * 40)
         
-        try:
-            agent = Agent(config=config)
-            response = await agent.run(prompt)
+        if isinstance(result, asyncio.TimeoutError):
+            print(f"⏱️  Timed out after {PROVIDER_TIMEOUT:.0f}s")
+        elif isinstance(result, Exception):
+            print(f"❌ Error: {format_error(result)}")
+        else:
+            response, elapsed = result
             print(response)
-        except Exception as e:
-            print(f"❌ Error: {e}")
+            print(f"⏱️  {elapsed:.2f}s")
 
 
 async def interactive_mode():
@@ -190,13 +236,11 @@ async def interactive_mode():
         stream_by_default=True
     )
     
-    agent = Agent(config=config, tools=create_sample_tools())
-    
-    # Set up streaming
-    callbacks = StreamCallback()
-    callbacks.on(EventType.STREAM_CHUNK, lambda e: print(e.content, end="", flush=True))
-    callbacks.on(EventType.STREAM_END, lambda e: print())
-    agent.callbacks = callbacks
+    agent = Agent(
+        config=config,
+        tools=create_sample_tools(),
+        callbacks=create_stream_callbacks(stream_end="")
+    )
     
     thread = Thread()
     
@@ -215,7 +259,7 @@ async def interactive_mode():
         except KeyboardInterrupt:
             break
         except Exception as e:
-            print(f"❌ Error: {e}")
+            print(f"❌ Error: {format_error(e)}")
     
     print("\nGoodbye!")
 
@@ -232,6 +276,9 @@ async def main():
     
     choice = input("\nChoice (1-4): ").strip()
     
+    # Streaming callbacks are built once and shared by every provider run
+    callbacks = create_stream_callbacks()
+    
     if choice == "1":
         # Test individual providers
         for provider in ["openai", "gemini", "anthropic"]:
@@ -240,7 +287,7 @@ async def main():
                 api_key_var = "GOOGLE_API_KEY"
             
             if os.getenv(api_key_var):
-                await test_provider(provider)
+                await test_provider(provider, callbacks=callbacks)
             else:
                 print(f"\n⚠️ Skipping {provider} (no {api_key_var} found)")
     
@@ -259,7 +306,7 @@ async def main():
                 api_key_var = "GOOGLE_API_KEY"
             
             if os.getenv(api_key_var):
-                await test_provider(provider)
+                await test_provider(provider, callbacks=callbacks)
         
         print("\n2️⃣ Comparing Providers")
         await compare_providers()
@@ -306,6 +353,4 @@ if __name__ == "__main__":
         sys.exit(1)
     
     print()
-    asyncio.run(main())
-
-
+    run_demo(main())
@@ -3,7 +3,6 @@
 Demo: Redis-backed session management for MiniAgent
 Shows persistent conversations across restarts
 """
-import asyncio
 import os
 import sys
 from datetime import datetime
@@ -20,6 +19,7 @@ from miniagent_framework.extensions.session import SessionAgent, SessionManager
 from miniagent_framework.extensions.redis_client import RedisConfig
 from miniagent_framework.core.tools import ToolRegistry, Tool, ToolResult
 from miniagent_framework.core.events import StreamCallback, Event, EventType
+from _runner import run_demo
 
 # Load environment variables
 load_dotenv()
@@ -286,19 +286,20 @@ Always use the appropriate tools to provide accurate responses.""",
                 continue
             
             # Handle commands
-            if user_input.lower() in ['quit', 'exit']:
+            command = user_input.lower()  # Lowercase once for all command checks
+            if command in ['quit', 'exit']:
                 await manager.end_session(session_id)
                 print("\n👋 Session saved. Goodbye!")
                 break
             
-            elif user_input.lower() == 'new':
+            elif command == 'new':
                 # Save current session and start new
                 await manager.end_session(session_id)
                 session_id = await manager.create_or_resume_session(user_id=user_id)
                 print(f"✨ Started new session: {session_id[:8]}...")
                 continue
             
-            elif user_input.lower() == 'list':
+            elif command == 'list':
                 sessions = await manager.list_sessions(user_id)
                 if sessions:
                     print(f"\n📚 Active sessions ({len(sessions)}):")
@@ -311,7 +312,7 @@ Always use the appropriate tools to provide accurate responses.""",
                     print("No active sessions found.")
                 continue
             
-            elif user_input.lower().startswith('resume '):
+            elif command.startswith('resume '):
                 resume_id = user_input[7:].strip()
                 sessions = await manager.list_sessions(user_id)
                 
@@ -331,7 +332,7 @@ Always use the appropriate tools to provide accurate responses.""",
                     print(f"Session '{resume_id}' not found.")
                 continue
             
-            elif user_input.lower() == 'history':
+            elif command == 'history':
                 history = await manager.get_history(session_id)
                 if history:
                     print("\n📜 Conversation history:")
@@ -343,12 +344,12 @@ Always use the appropriate tools to provide accurate responses.""",
                     print("No history in current session.")
                 continue
             
-            elif user_input.lower() == 'clear':
+            elif command == 'clear':
                 await manager.clear_history(session_id)
                 print("✨ Session history cleared.")
                 continue
             
-            elif user_input.lower() == 'help':
+            elif command == 'help':
                 print("\nCommands:")
                 print("  • 'new' - Start a new session")
                 print("  • 'list' - List all active sessions")
@@ -389,5 +390,4 @@ if __name__ == "__main__":
     print("\n🎯 Redis Session Management Demo")
     print("This demo shows persistent conversations that survive restarts.\n")
     
-    asyncio.run(main())
-
+    run_demo(main())
@@ -93,6 +93,7 @@ class AgentConfig:
     max_tokens: int = 2000
     retry_policy: Optional[RetryPolicy] = None
     stream_by_default: bool = True
+    collect_stream: bool = False  # Emit one STREAM_CHUNK per response instead of one per token
 
 
 class Agent:
@@ -192,7 +193,7 @@ class Agent:
 
                 if stream and iteration == 0:  # Only stream the first response
                     # Stream initial response
-                    accumulated = ""
+                    chunks: List[str] = []
                     tool_calls_detected = []
 
                     await self.callbacks.emit(Event(EventType.STREAM_START, None))
@@ -211,10 +212,11 @@ class Agent:
                             tool_calls_detected = chunk["tool_calls"]
                             await self.callbacks.emit(Event(EventType.AGENT_THINKING, {"tool_calls": tool_calls_detected}))
                         elif isinstance(chunk, str):
-                            accumulated += chunk
-                            await self.callbacks.emit(Event(EventType.STREAM_CHUNK, chunk))
+                            chunks.append(chunk)
+                            if not self.config.collect_stream:
+                                await self.callbacks.emit(Event(EventType.STREAM_CHUNK, chunk))
 
-                    await self.callbacks.emit(Event(EventType.STREAM_END, accumulated))
+                    accumulated = await self._finish_stream(chunks)
 
                     if tool_calls_detected:
                         # Format and add tool calls to thread
@@ -290,6 +292,21 @@ class Agent:
         # Max iterations reached
         return "I apologize, but I couldn't complete the task within the allowed iterations. Please try rephrasing your request."
     
+    async def _finish_stream(self, chunks: List[str]) -> str:
+        """
+        Join streamed chunks and emit the end-of-stream events.
+        With collect_stream, the whole response goes out as a single STREAM_CHUNK.
+        """
+        accumulated = "".join(chunks)
+        if self.config.collect_stream and chunks:
+            await self.callbacks.emit(Event(
+                EventType.STREAM_CHUNK,
+                accumulated,
+                metadata={"n_chunks": len(chunks)}
+            ))
+        await self.callbacks.emit(Event(EventType.STREAM_END, accumulated))
+        return accumulated
+    
     async def _decide_action(self, thread: Thread, context: Optional[str]) -> Dict:
         """
         Decide what action to take
@@ -437,7 +454,7 @@ Respond with JSON indicating your decision."""
         
         if stream:
             # Stream response
-            accumulated = ""
+            chunks: List[str] = []
             await self.callbacks.emit(Event(EventType.STREAM_START, None))
             
             # Get the async generator
@@ -445,10 +462,11 @@ Respond with JSON indicating your decision."""
             
             # Iterate over the generator
             async for chunk in stream_gen:
-                accumulated += chunk
-                await self.callbacks.emit(Event(EventType.STREAM_CHUNK, chunk))
+                chunks.append(chunk)
+                if not self.config.collect_stream:
+                    await self.callbacks.emit(Event(EventType.STREAM_CHUNK, chunk))
             
-            await self.callbacks.emit(Event(EventType.STREAM_END, accumulated))
+            accumulated = await self._finish_stream(chunks)
             
             # Add to thread
             thread.add_message(Message("assistant", accumulated))
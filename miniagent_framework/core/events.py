@@ -92,7 +92,7 @@ class StreamCallback:
     def __init__(self, allow_multiple_handlers: bool = True):
         self.allow_multiple_handlers = allow_multiple_handlers
         self.handlers: Dict[EventType, List[Callable]] = {}
-        self._default_handler: Optional[Callable] = None
+        self._any_handlers: List[Callable] = []
     
     def on(self, event_type: EventType, handler: Callable):
         """Register a handler for an event type"""
@@ -106,11 +106,24 @@ class StreamCallback:
             self.handlers[event_type] = [handler]
         return self
     
-    def on_any(self, handler: Callable):
-        """Register a handler for all events"""
-        self._default_handler = handler
+    def on_any(self, handler: Optional[Callable]):
+        """Register a handler for all events (one subscription, not one per EventType)"""
+        if handler is None:
+            # Backward compatibility: on_any(None) clears the catch-all handlers
+            self._any_handlers.clear()
+        elif self.allow_multiple_handlers:
+            self._any_handlers.append(handler)
+        else:
+            self._any_handlers = [handler]
         return self
     
+    def off_any(self, handler: Callable = None):
+        """Unregister a catch-all handler, or all of them if no handler is given"""
+        if handler is None:
+            self._any_handlers.clear()
+        elif handler in self._any_handlers:
+            self._any_handlers.remove(handler)
+    
     def off(self, event_type: EventType, handler: Callable = None):
         """Unregister a handler"""
         if event_type in self.handlers:
@@ -140,16 +153,16 @@ class StreamCallback:
                     import logging
                     logging.error(f"Error in event handler for {event.type}: {e}")
         
-        # Call default handler
-        if self._default_handler:
+        # Call handlers registered for all events
+        for handler in self._any_handlers:
             try:
-                if asyncio.iscoroutinefunction(self._default_handler):
-                    await self._default_handler(event)
+                if asyncio.iscoroutinefunction(handler):
+                    await handler(event)
                 else:
-                    self._default_handler(event)
+                    handler(event)
             except Exception as e:
                 import logging
-                logging.error(f"Error in default event handler: {e}")
+                logging.error(f"Error in catch-all event handler for {event.type}: {e}")
     
     # Convenience methods for common events
     def on_thinking(self, handler: Callable):
@@ -179,4 +192,4 @@ class StreamCallback:
     def clear(self):
         """Clear all handlers"""
         self.handlers.clear()
-        self._default_handler = None
\ No newline at end of file
+        self._any_handlers.clear()
\ No newline at end of file
@@ -4,6 +4,7 @@ Tool system with registry, execution, error handling, and token optimization
 from typing import Dict, Any, Optional, Callable, List, Union
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from collections import Counter
 import asyncio
 import json
 import inspect
@@ -428,6 +429,7 @@ class ToolRegistry:
         self.optimize_for_tokens = optimize_for_tokens
         self._total_executions = 0
         self._total_tokens_saved = 0
+        self._tool_usage: Counter = Counter()
     
     def register(self, tool: Tool):
         """Register a tool"""
@@ -496,6 +498,7 @@ class ToolRegistry:
             )
         
         self._total_executions += 1
+        self._tool_usage[tool_name] += 1
         
         # Execute based on tool type
         if isinstance(tool, EnhancedTool):
@@ -519,6 +522,7 @@ class ToolRegistry:
             "tools_registered": len(self.tools),
             "enhanced_tools": enhanced_tools,
             "basic_tools": basic_tools,
+            "tool_usage": dict(self._tool_usage.most_common()),  # Most used first
             "tool_stats": {}
         }
         
@@ -743,12 +747,12 @@ class KnowledgeBaseTool(Tool):
     async def execute(self, topic: str) -> ToolResult:
         """Search knowledge base"""
         # Find matching topics
-        matches = []
-        topic_lower = topic.lower()
-        
-        for key, value in self.knowledge.items():
-            if topic_lower in key.lower() or topic_lower in value.lower():
-                matches.append((key, value))
+        topic_folded = topic.casefold()
+        matches = [
+            (key, value)
+            for key, value in self.knowledge.items()
+            if topic_folded in key.casefold() or topic_folded in value.casefold()
+        ]
         
         if matches:
             display = f"📚 Knowledge base results for '{topic}':\n\n"